@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+
+class BDDManager:
+    """
+    Builds and stores reduced ordered binary decision diagrams (ROBDDs).
+
+    Nodes are plain integers: 0 is the false terminal, 1 is the true terminal,
+    and every internal node is a `(level, low, high)` triple registered in a
+    unique table, so structurally equal diagrams always reduce to the same
+    integer. Because ROBDDs are canonical for a fixed variable order, checking
+    two formulas for equivalence or a formula for tautology becomes a single
+    integer comparison once they are built through the same manager.
+
+    Examples
+    --------
+    >>> manager = BDDManager()
+    >>> p, q = manager.var("P"), manager.var("Q")
+    >>> manager.apply("&", p, q) == manager.negate(manager.apply("|", manager.negate(p), manager.negate(q)))
+    True
+    >>> manager.apply("|", p, manager.negate(p)) == manager.true
+    True
+
+    """
+
+    _operations = {
+        "&": lambda left, right: left and right,
+        "|": lambda left, right: left or right,
+        "->": lambda left, right: (not left) or right,
+        "<->": lambda left, right: left == right,
+    }
+
+    def __init__(self):
+        self.false = 0
+        self.true = 1
+        self._levels = {}
+        self._triples = [None, None]
+        self._unique = {}
+        self._apply_cache = {}
+
+    def declare(self, name: str) -> int:
+        """
+        Registers a variable name and returns its level in the ordering.
+
+        Variables are ordered by declaration; declaring an existing name is a
+        no-op, so the order is fixed by the first declaration of each name.
+        """
+        level = self._levels.get(name)
+        if level is None:
+            level = len(self._levels)
+            self._levels[name] = level
+        return level
+
+    def var(self, name: str) -> int:
+        """Returns the node that tests a single variable, declaring it if needed."""
+        return self._make(self.declare(name), self.false, self.true)
+
+    def negate(self, node: int) -> int:
+        """Returns the node representing the negation of `node`."""
+        return self.apply("->", node, self.false)
+
+    def apply(self, operator: str, left: int, right: int) -> int:
+        """
+        Combines two nodes with a binary connective (`&`, `|`, `->` or `<->`).
+
+        The recursion expands both operands on the topmost variable of either
+        diagram and memoizes every `(operator, left, right)` triple, so shared
+        substructure is combined only once.
+        """
+        key = (operator, left, right)
+        cached = self._apply_cache.get(key)
+        if cached is not None:
+            return cached
+        if left <= 1 and right <= 1:
+            operation = BDDManager._operations[operator]
+            result = self.true if operation(left == 1, right == 1) else self.false
+        else:
+            level = min(self._level_of(left), self._level_of(right))
+            low_left, high_left = self._cofactors(left, level)
+            low_right, high_right = self._cofactors(right, level)
+            result = self._make(
+                level,
+                self.apply(operator, low_left, low_right),
+                self.apply(operator, high_left, high_right),
+            )
+        self._apply_cache[key] = result
+        return result
+
+    def _make(self, level: int, low: int, high: int) -> int:
+        """Returns the reduced node for a triple, reusing the unique table."""
+        if low == high:
+            return low
+        triple = (level, low, high)
+        node = self._unique.get(triple)
+        if node is None:
+            node = len(self._triples)
+            self._triples.append(triple)
+            self._unique[triple] = node
+        return node
+
+    def _level_of(self, node: int) -> float:
+        """Returns the variable level of a node; terminals sit below every level."""
+        return self._triples[node][0] if node > 1 else float("inf")
+
+    def _cofactors(self, node: int, level: int) -> tuple[int, int]:
+        """Returns the restrictions of `node` with the variable at `level` set
+        to false and to true."""
+        if node <= 1 or self._triples[node][0] != level:
+            return node, node
+        _, low, high = self._triples[node]
+        return low, high
+
+
+_default_manager = None
+
+
+def default_manager() -> BDDManager:
+    """
+    Returns the shared manager used when `to_robdd` is called without one.
+
+    Keeping one process-wide manager means diagrams built in separate calls
+    share a variable order and a unique table, so their nodes can be compared
+    directly for equivalence checks.
+    """
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = BDDManager()
+    return _default_manager
@@ -1,2 +1,26 @@
 from .atoms import *
-from .identities import *
+from . import identities as _identities
+
+__all__ = [
+    "LogicFormula",
+    "P",
+    "Q",
+    "R",
+    "S",
+    "T",
+    "TRUE",
+    "FALSE",
+    "PHI",
+    "PSI",
+    "CHI",
+    *_identities.__all__,
+]
+
+
+def __getattr__(name):
+    """Resolves identity formulas lazily, so they are only built when accessed."""
+    if name in _identities.__all__:
+        formula = getattr(_identities, name)
+        globals()[name] = formula
+        return formula
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
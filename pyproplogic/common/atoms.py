@@ -6,6 +6,9 @@ R = LogicFormula.atom("R")
 S = LogicFormula.atom("S")
 T = LogicFormula.atom("T")
 
+TRUE = LogicFormula.TRUE
+FALSE = LogicFormula.FALSE
+
 PHI = LogicFormula.atom("φ")
 PSI = LogicFormula.atom("ψ")
 CHI = LogicFormula.atom("χ")
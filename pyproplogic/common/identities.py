@@ -1,23 +1,39 @@
-from pyproplogic.common import PHI, PSI, CHI
-
-DOUBLE_NEGATION = (~~PHI) == (PHI)
-
-IDEMPOTENT_AND = (PHI & PHI) == (PHI)
-IDEMPOTENT_OR = (PHI | PHI) == (PHI)
-
-COMMUTATIVE_AND = (PHI & PSI) == (PSI & PHI)
-COMMUTATIVE_OR = (PHI | PSI) == (PSI | PHI)
-
-ASSOCIATIVE_AND = ((PHI & PSI) & CHI) == (PHI & (PSI & CHI))
-ASSOCIATIVE_OR = ((PHI | PSI) | CHI) == (PHI | (PSI | CHI))
-
-DISTRIBUTIVE_1 = (PHI & (PSI | CHI)) == ((PHI & PSI) | (PHI & CHI))
-DISTRIBUTIVE_2 = (PHI | (PSI & CHI)) == ((PHI | PSI) & (PHI | CHI))
-
-DE_MORGAN_AND = (~(PHI & PSI)) == (~PHI | ~PSI)
-DE_MORGAN_OR = (~(PHI | PSI)) == (~PHI & ~PSI)
-
-ABSORPTION_1 = (PHI & (PHI | PSI)) == (PHI)
-ABSORPTION_2 = (PHI | (PHI & PSI)) == (PHI)
-
-IMPLICATION = (PHI >> PSI) == (~PHI | PSI)
+from pyproplogic.common.atoms import LogicFormula, PHI, PSI, CHI
+
+
+def _nested(operator, left, right):
+    """Builds a binary node without the associative flattening, so the
+    associativity identities keep their two distinct groupings."""
+    return LogicFormula(operator, left, right, _flatten=False)
+
+
+_builders = {
+    "DOUBLE_NEGATION": lambda: (~~PHI) == (PHI),
+    "IDEMPOTENT_AND": lambda: (PHI & PHI) == (PHI),
+    "IDEMPOTENT_OR": lambda: (PHI | PHI) == (PHI),
+    "COMMUTATIVE_AND": lambda: (PHI & PSI) == (PSI & PHI),
+    "COMMUTATIVE_OR": lambda: (PHI | PSI) == (PSI | PHI),
+    "ASSOCIATIVE_AND": lambda: _nested("&", PHI & PSI, CHI)
+    == _nested("&", PHI, PSI & CHI),
+    "ASSOCIATIVE_OR": lambda: _nested("|", PHI | PSI, CHI)
+    == _nested("|", PHI, PSI | CHI),
+    "DISTRIBUTIVE_1": lambda: (PHI & (PSI | CHI)) == ((PHI & PSI) | (PHI & CHI)),
+    "DISTRIBUTIVE_2": lambda: (PHI | (PSI & CHI)) == ((PHI | PSI) & (PHI | CHI)),
+    "DE_MORGAN_AND": lambda: (~(PHI & PSI)) == (~PHI | ~PSI),
+    "DE_MORGAN_OR": lambda: (~(PHI | PSI)) == (~PHI & ~PSI),
+    "ABSORPTION_1": lambda: (PHI & (PHI | PSI)) == (PHI),
+    "ABSORPTION_2": lambda: (PHI | (PHI & PSI)) == (PHI),
+    "IMPLICATION": lambda: (PHI >> PSI) == (~PHI | PSI),
+}
+
+__all__ = list(_builders)
+
+
+def __getattr__(name):
+    """Builds an identity formula on its first access and caches it on the module."""
+    builder = _builders.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    formula = builder()
+    globals()[name] = formula
+    return formula
@@ -1,5 +1,50 @@
 from __future__ import annotations
 import warnings
+import weakref
+from types import MappingProxyType
+from typing import Callable, Iterator
+
+_MISSING = object()
+
+_numpy = _MISSING
+_dataframe = _MISSING
+
+
+def _get_numpy():
+    """Returns the numpy module, or None when the optional dependency is missing.
+
+    The import is attempted once and the result is cached for the process."""
+    global _numpy
+    if _numpy is _MISSING:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _solve_sat(formula: "LogicFormula") -> bool:
+    """Decides satisfiability through the Tseitin encoding and the DPLL solver."""
+    from pyproplogic.sat import dpll, to_cnf_tseitin
+
+    return dpll(*to_cnf_tseitin(formula))
+
+
+def _get_dataframe():
+    """Returns pandas.DataFrame, or None when the optional dependency is missing.
+
+    The import is attempted once and the result is cached for the process."""
+    global _dataframe
+    if _dataframe is _MISSING:
+        try:
+            from pandas import DataFrame
+
+            _dataframe = DataFrame
+        except ImportError:
+            _dataframe = None
+    return _dataframe
 
 
 class LogicFormula:
@@ -18,6 +63,10 @@ class LogicFormula:
     _components: str or LogicFormula objects
         The components of the logic formula, that are strings or LogicFormula objects.
 
+    Formulas are interned: constructing the same formula twice returns the same object,
+    so structurally equal formulas can be compared with the `is` operator. The cache
+    holds weak references, letting unused formulas be garbage collected.
+
     Notes
     -----
     The class supports the use of Python's binary operators to construct formulas, with the following
@@ -43,54 +92,225 @@ class LogicFormula:
 
     """
 
-    _valid_operators = ("atom", "~", "&", "|", "->", "<->")
-    _unicode_dict = {"~": "¬", "&": "∧", "|": "∨", "->": "→", "<->": "↔"}
-    _utf_dict = {
-        "~": "\u00AC",
-        "&": "\u2227",
-        "|": "\u2228",
-        "->": "\u2192",
-        "<->": "\u2194",
-    }
-    _latex_dict = {
-        "~": r"\lnot ",
-        "&": r"\land",
-        "|": r"\lor",
-        "->": r"\rightarrow",
-        "<->": r"\leftrightarrow",
+    __slots__ = (
+        "_operator",
+        "_components",
+        "_symbol",
+        "_symbol_tuple",
+        "_prec",
+        "_hash",
+        "_str_cache",
+        "_atoms_cache",
+        "_sorted_atoms_cache",
+        "_subformulas_cache",
+        "_subformula_ids",
+        "_compiled_cache",
+        "_tautology_cache",
+        "_contradiction_cache",
+        "_bdd_cache",
+        "__weakref__",
+    )
+
+    _valid_operators = frozenset(("atom", "~", "&", "|", "->", "<->", "TRUE", "FALSE"))
+    _arity = {"atom": 1, "~": 1, "&": 2, "|": 2, "->": 2, "<->": 2, "TRUE": 0, "FALSE": 0}
+    _precedence = {
+        "atom": 4,
+        "~": 3,
+        "&": 2,
+        "|": 2,
+        "->": 1,
+        "<->": 1,
+        "TRUE": 4,
+        "FALSE": 4,
     }
+    _unicode_dict = MappingProxyType(
+        {"~": "¬", "&": "∧", "|": "∨", "->": "→", "<->": "↔", "TRUE": "⊤", "FALSE": "⊥"}
+    )
+    _utf_dict = MappingProxyType(
+        {
+            "~": "\u00AC",
+            "&": "\u2227",
+            "|": "\u2228",
+            "->": "\u2192",
+            "<->": "\u2194",
+            "TRUE": "\u22A4",
+            "FALSE": "\u22A5",
+        }
+    )
+    _latex_dict = MappingProxyType(
+        {
+            "~": r"\lnot ",
+            "&": r"\land",
+            "|": r"\lor",
+            "->": r"\rightarrow",
+            "<->": r"\leftrightarrow",
+            "TRUE": r"\top",
+            "FALSE": r"\bot",
+        }
+    )
+    _ascii_dict = MappingProxyType(
+        {
+            "~": "~",
+            "&": "&",
+            "|": "|",
+            "->": "->",
+            "<->": "<->",
+            "TRUE": "TRUE",
+            "FALSE": "FALSE",
+        }
+    )
     _current_dict = _utf_dict
+    _tikz_child_template = "child {{node {{${}$}}"
+    _tikz_template = (
+        "\\begin{{tikzpicture}}\n"
+        "[level/.style={{{}}}]\n"
+        "{}\n"
+        "\\end{{tikzpicture}}"
+    )
+    _intern = weakref.WeakValueDictionary()
+    _bit_column_cache = {}
+    # Above this many atoms, 2^n enumeration is abandoned in favour of the
+    # DPLL solver in pyproplogic.sat.
+    _sat_solver_threshold = 20
+    _eval_dispatch = {
+        "&": lambda components, values, index, memo: all(
+            component._eval_vec(values, index, memo) for component in components
+        ),
+        "|": lambda components, values, index, memo: any(
+            component._eval_vec(values, index, memo) for component in components
+        ),
+        "->": lambda components, values, index, memo: (
+            not components[0]._eval_vec(values, index, memo)
+        )
+        or components[1]._eval_vec(values, index, memo),
+        "<->": lambda components, values, index, memo: components[0]._eval_vec(
+            values, index, memo
+        )
+        == components[1]._eval_vec(values, index, memo),
+    }
 
-    def __init__(self, operator: str, *components: LogicFormula):
-        if operator not in LogicFormula._valid_operators:
+    def __new__(cls, operator: str, *components: LogicFormula, _flatten: bool = True):
+        arity = cls._arity.get(operator)
+        if arity is None:
             raise ValueError("invalid operator: " + operator)
-        if operator in ["atom", "~"] and len(components) != 1:
-            raise ValueError(
-                f"unary operator '{operator}' requires exactly 1 component"
-            )
-        if operator not in ["atom", "~"] and len(components) != 2:
+        if operator == "&" or operator == "|":
+            if len(components) < arity:
+                raise ValueError(
+                    f"operator '{operator}' requires at least 2 components"
+                )
+            if _flatten and any(
+                component._operator == operator for component in components
+            ):
+                flattened = []
+                for component in components:
+                    if component._operator == operator:
+                        flattened.extend(component._components)
+                    else:
+                        flattened.append(component)
+                components = tuple(flattened)
+        elif len(components) != arity:
+            if arity == 0:
+                raise ValueError(f"constant '{operator}' takes no components")
+            if arity == 1:
+                raise ValueError(
+                    f"unary operator '{operator}' requires exactly 1 component"
+                )
             raise ValueError(
                 f"binary operator '{operator}' requires exactly 2 components"
             )
-        self._operator = operator
-        self._components = components
+        if operator == "atom":
+            key = (operator, components[0])
+        else:
+            key = (operator, *(id(component) for component in components))
+        self = cls._intern.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            self._operator = operator
+            if operator == "atom":
+                self._symbol = components[0]
+                self._symbol_tuple = components
+                self._components = ()
+            else:
+                self._symbol = None
+                self._symbol_tuple = None
+                self._components = components
+            self._prec = cls._precedence[operator]
+            if operator == "atom":
+                self._atoms_cache = (self,)
+            elif len(components) == 1:
+                self._atoms_cache = components[0]._atoms_cache
+            elif not components:
+                self._atoms_cache = ()
+            else:
+                union = {}
+                for component in components:
+                    for atom in component._atoms_cache:
+                        union.setdefault(id(atom), atom)
+                self._atoms_cache = tuple(union.values())
+            self._hash = None
+            self._str_cache = None
+            self._sorted_atoms_cache = None
+            self._subformulas_cache = None
+            self._subformula_ids = None
+            self._compiled_cache = None
+            self._tautology_cache = None
+            self._contradiction_cache = None
+            self._bdd_cache = None
+            cls._intern[key] = self
+        return self
 
     def __str__(self) -> str:
-        if self.operator() == "atom":
-            return self.components()[0]
-        precedence = {"atom": 4, "~": 3, "&": 2, "|": 2, "->": 1, "<->": 1}
-        subformula_str = [
-            f"({subformula})"
-            if precedence[subformula.operator()] <= precedence[self.operator()]
-            else str(subformula)
-            for subformula in self.components()
-        ]
-        if self.operator() == "~":
-            return LogicFormula._current_dict["~"] + subformula_str[0]
-        elif self.operator() in LogicFormula._current_dict:
-            return f" {LogicFormula._current_dict[self.operator()]} ".join(
-                subformula_str
-            )
+        return self._render(LogicFormula._current_dict)
+
+    def _render(self, symbols: dict[str]) -> str:
+        """
+        Renders the formula as a string using the given symbol dictionary.
+
+        Rendering never touches the class-level symbol state, so different symbol
+        dictionaries can be used concurrently. The result is cached on each node,
+        keyed by the symbol dictionary it was rendered with.
+        """
+        key = id(symbols)
+        cached = self._str_cache
+        if cached is not None:
+            entry = cached.get(key)
+            if entry is not None and entry[0] is symbols:
+                return entry[1]
+        parts = []
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            cached = item._str_cache
+            if cached is not None:
+                entry = cached.get(key)
+                if entry is not None and entry[0] is symbols:
+                    parts.append(entry[1])
+                    continue
+            if item.is_atomic():
+                parts.append(item._symbol)
+                continue
+            if not item._components:
+                parts.append(symbols[item._operator])
+                continue
+            pieces = []
+            if item._operator == "~":
+                pieces.append(symbols["~"])
+            for subformula in item._components:
+                if item._operator != "~" and pieces:
+                    pieces.append(f" {symbols[item._operator]} ")
+                if subformula._prec <= item._prec:
+                    pieces.extend(("(", subformula, ")"))
+                else:
+                    pieces.append(subformula)
+            stack.extend(reversed(pieces))
+        string = "".join(parts)
+        if self._str_cache is None:
+            self._str_cache = {}
+        self._str_cache[key] = (symbols, string)
+        return string
 
     def __repr__(self) -> str:
         return f"LogicFormula({self.__str__()})"
@@ -100,20 +320,32 @@ class LogicFormula:
             raise TypeError(
                 f"'in' requires LogicFormula as left operand, not {type(item).__name__}"
             )
-        return (item.to_ascii()) in (self.to_ascii())
+        ids = self._subformula_ids
+        if ids is None:
+            ids = frozenset(id(subformula) for subformula in self.iter_subformulas())
+            self._subformula_ids = ids
+        return id(item) in ids
 
-    def __iter__(self) -> LogicFormula:
-        return iter(self.get_subformulas())
+    def __iter__(self) -> Iterator[LogicFormula]:
+        return self.iter_subformulas()
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            if self._operator == "atom":
+                self._hash = hash(self._symbol)
+            else:
+                self._hash = hash((self._operator, self._components))
+        return self._hash
 
     def operator(self) -> str:
         """Returns the logic operator of the current formula."""
         return self._operator
 
     def components(self) -> tuple[LogicFormula]:
-        """Returns a tuple containing the component(s) of the current formula."""
+        """Returns a tuple containing the component(s) of the current formula.
+        The returned tuple is the stored structure itself, never a fresh copy."""
+        if self._operator == "atom":
+            return self._symbol_tuple
         return self._components
 
     @staticmethod
@@ -121,49 +353,155 @@ class LogicFormula:
         """Creates a LogicFormula object containing an atom with the given symbol."""
         return LogicFormula("atom", symbol)
 
+    @staticmethod
+    def _coerce(value):
+        """Lifts Python booleans to the TRUE/FALSE constants and strings to atoms."""
+        if value is True:
+            return LogicFormula.TRUE
+        if value is False:
+            return LogicFormula.FALSE
+        if isinstance(value, str):
+            return LogicFormula.atom(value)
+        return value
+
     def negation(self) -> LogicFormula:
-        """Creates a LogicFormula object containing the negation of self."""
+        """Creates a LogicFormula object containing the negation of self.
+        Negating a constant folds to the opposite constant."""
+        if self is LogicFormula.TRUE:
+            return LogicFormula.FALSE
+        if self is LogicFormula.FALSE:
+            return LogicFormula.TRUE
         return LogicFormula("~", self)
 
     def __invert__(self):
-        return LogicFormula("~", self)
+        return self.negation()
 
     def conjunction(self, other) -> LogicFormula:
-        """Creates a LogicFormula object containing a conjunction between self and other."""
+        """Creates a LogicFormula object containing a conjunction between self and other.
+        Constant operands fold: `x & TRUE` is `x` and `x & FALSE` is `FALSE`."""
+        other = LogicFormula._coerce(other)
+        if self is LogicFormula.FALSE or other is LogicFormula.FALSE:
+            return LogicFormula.FALSE
+        if self is LogicFormula.TRUE:
+            return other
+        if other is LogicFormula.TRUE:
+            return self
         return LogicFormula("&", self, other)
 
     def __and__(self, other) -> LogicFormula:
-        return LogicFormula("&", self, other)
+        return self.conjunction(other)
+
+    __rand__ = __and__
 
     def disjunction(self, other) -> LogicFormula:
-        """Creates a LogicFormula object containing a disjunction between self and other."""
+        """Creates a LogicFormula object containing a disjunction between self and other.
+        Constant operands fold: `x | FALSE` is `x` and `x | TRUE` is `TRUE`."""
+        other = LogicFormula._coerce(other)
+        if self is LogicFormula.TRUE or other is LogicFormula.TRUE:
+            return LogicFormula.TRUE
+        if self is LogicFormula.FALSE:
+            return other
+        if other is LogicFormula.FALSE:
+            return self
         return LogicFormula("|", self, other)
 
     def __or__(self, other) -> LogicFormula:
-        return LogicFormula("|", self, other)
+        return self.disjunction(other)
+
+    __ror__ = __or__
 
     def implication(self, other) -> LogicFormula:
-        """Creates a LogicFormula object containing an implication from self to other."""
+        """Creates a LogicFormula object containing an implication from self to other.
+        Constant operands fold, e.g. `FALSE >> x` and `x >> TRUE` are `TRUE`."""
+        other = LogicFormula._coerce(other)
+        if self is LogicFormula.FALSE or other is LogicFormula.TRUE:
+            return LogicFormula.TRUE
+        if self is LogicFormula.TRUE:
+            return other
+        if other is LogicFormula.FALSE:
+            return self.negation()
         return LogicFormula("->", self, other)
 
     def __rshift__(self, other) -> LogicFormula:
-        return LogicFormula("->", self, other)
+        return self.implication(other)
+
+    def __rrshift__(self, other) -> LogicFormula:
+        return LogicFormula._coerce(other).implication(self)
 
     def biconditional(self, other) -> LogicFormula:
-        """Creates a LogicFormula object containing a biconditional between self and other."""
+        """Creates a LogicFormula object containing a biconditional between self and other.
+        Constant operands fold, e.g. `x == TRUE` is `x` and `x == FALSE` is `~x`."""
+        other = LogicFormula._coerce(other)
+        if self is LogicFormula.TRUE:
+            return other
+        if other is LogicFormula.TRUE:
+            return self
+        if self is LogicFormula.FALSE:
+            return other.negation()
+        if other is LogicFormula.FALSE:
+            return self.negation()
         return LogicFormula("<->", self, other)
 
     def __eq__(self, other) -> LogicFormula:
-        return LogicFormula("<->", self, other)
+        return self.biconditional(other)
 
     def is_atomic(self) -> bool:
         """Determines if the current formula is an atom or not."""
         return self.operator() == "atom"
 
-    def get_atoms(self) -> list[LogicFormula]:
+    def iter_subformulas(self) -> Iterator[LogicFormula]:
+        """
+        Iterates over the distinct subformulas of the current formula.
+
+        Each subformula is yielded exactly once, in traversal order, without
+        materializing an intermediate list. Use `get_subformulas` when a sorted
+        list is needed.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> sum(1 for _ in (P >> (P & ~Q)).iter_subformulas())
+        5
+
+        """
+        seen = set()
+        stack = [self]
+        while stack:
+            formula = stack.pop()
+            identity = id(formula)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            yield formula
+            if not formula.is_atomic():
+                stack.extend(formula._components)
+
+    def iter_atoms(self) -> Iterator[LogicFormula]:
+        """
+        Iterates over the distinct atoms of the current formula, in traversal order.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> sorted(str(atom) for atom in (P >> (P & ~Q)).iter_atoms())
+        ['P', 'Q']
+
+        """
+        return (
+            formula for formula in self.iter_subformulas() if formula.is_atomic()
+        )
+
+    def get_atoms(self, ordered: bool = True) -> list[LogicFormula]:
         """
         Returns a list containing all atoms of the formula.
 
+        Parameters
+        ----------
+        ordered: bool, optional
+            Decides if the atoms should be sorted by their string representation.
+            When False, the atoms are returned in traversal order, skipping the sort.
+            Default value is True.
+
         Returns
         -------
         atoms: list of str
@@ -176,21 +514,29 @@ class LogicFormula:
         [LogicFormula(P), LogicFormula(Q), LogicFormula(R)]
 
         """
-        if self.is_atomic():
-            return [self]
-        atoms = []
-        for subformula in self.components():
-            atoms.extend(subformula.get_atoms())
-        return sorted(set(atoms), key=str)
-
-    def get_subformulas(self) -> list[LogicFormula]:
+        if not ordered:
+            return list(self._atoms_cache)
+        cached = self._sorted_atoms_cache
+        if cached is None:
+            cached = tuple(sorted(self._atoms_cache, key=str))
+            self._sorted_atoms_cache = cached
+        return list(cached)
+
+    def get_subformulas(self, ordered: bool = True) -> list[LogicFormula]:
         """
         Returns a list containing all subformulas of the current formula.
 
-        * If the current formula is an atomic formula, returns itself
-        * If the current formula is a complex formula, creates a list with it and recursively
-        calls this method on its subformulas, appending the results to the list, which is then
-        sorted and returned with duplicates removed.
+        The formula tree is walked iteratively, visiting each distinct subformula exactly
+        once; since formulas are interned, duplicates are detected by object identity
+        without comparing string representations.
+
+        Parameters
+        ----------
+        ordered: bool, optional
+            Decides if the subformulas should be sorted by the length of their string
+            representation. When False, the subformulas are returned in traversal order,
+            skipping the sort.
+            Default value is True.
 
         Returns
         -------
@@ -208,15 +554,20 @@ class LogicFormula:
         LogicFormula(P → P ∧ ¬Q)]
 
         """
-        if self.is_atomic():
-            return [self]
-        else:
-            subformulas = [self]
-            for subformula in self.components():
-                subformulas.extend(subformula.get_subformulas())
-        return sorted(set(subformulas), key=lambda f: (len(str(f)), str(f)))
+        cached = self._subformulas_cache
+        if cached is None:
+            cached = tuple(self.iter_subformulas())
+            self._subformulas_cache = cached
+        if not ordered:
+            return list(cached)
+
+        def sort_key(formula: LogicFormula) -> tuple[int, str]:
+            string = str(formula)
+            return (len(string), string)
+
+        return sorted(cached, key=sort_key)
 
-    def eval(self, valuation: dict[bool]) -> bool:
+    def eval(self, valuation: dict[bool], _memo: dict = None) -> bool:
         """
         Evaluates the formula using the truth values given by a dictionary.
 
@@ -240,23 +591,207 @@ class LogicFormula:
         False
 
         """
-        if self.is_atomic():
-            return (
-                valuation[self]
-                if self in valuation.keys()
-                else valuation[self.components()[0]]
+        values, index = self._prepare_valuation(valuation)
+        if _memo is None and self._components:
+            _memo = {}
+        return self._eval_vec(values, index, _memo)
+
+    def _prepare_valuation(
+        self, valuation: dict
+    ) -> tuple[list[bool], dict[int, int]]:
+        """
+        Converts a user valuation dictionary into a positional truth vector.
+
+        Returns the vector together with a mapping from atom ids to positions,
+        so atom lookups during evaluation cost a single list index instead of
+        repeated dictionary probes over formula or string keys.
+        """
+        atoms = self.get_atoms(ordered=False)
+        index = {id(atom): position for position, atom in enumerate(atoms)}
+        values = []
+        for atom in atoms:
+            value = valuation.get(atom, _MISSING)
+            if value is _MISSING:
+                value = valuation[atom._symbol]
+            values.append(value)
+        return values, index
+
+    def _eval_vec(
+        self, values: list[bool], index: dict[int, int], memo: dict = None
+    ) -> bool:
+        """Evaluates the formula over a positional truth vector."""
+        if memo is not None:
+            value = memo.get(id(self), _MISSING)
+            if value is not _MISSING:
+                return value
+        operator = self._operator
+        if operator == "atom":
+            value = values[index[id(self)]]
+        elif operator == "~":
+            value = not self._components[0]._eval_vec(values, index, memo)
+        elif operator == "TRUE":
+            value = True
+        elif operator == "FALSE":
+            value = False
+        else:
+            value = LogicFormula._eval_dispatch[operator](
+                self._components, values, index, memo
             )
-        elif self.operator() == "~":
-            return not self.components()[0].eval(valuation)
-        left, right = self.components()
-        if self.operator() == "&":
-            return left.eval(valuation) and right.eval(valuation)
-        elif self.operator() == "|":
-            return left.eval(valuation) or right.eval(valuation)
-        elif self.operator() == "->":
-            return (not left.eval(valuation)) or right.eval(valuation)
-        elif self.operator() == "<->":
-            return left.eval(valuation) == right.eval(valuation)
+        if memo is not None:
+            memo[id(self)] = value
+        return value
+
+    def compile(self) -> Callable[[list[bool]], bool]:
+        """
+        Compiles the formula into a reusable evaluation function.
+
+        The formula tree is translated once into nested closures, so the returned
+        function performs no operator dispatch. This pays off when the same formula
+        is evaluated under many different valuations.
+
+        Returns
+        -------
+        compiled: callable
+            A function mapping a list of truth values to the formula's truth value.
+            The truth values must be ordered as the atoms returned by `get_atoms()`.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> compiled = (P >> ~Q).compile()
+        >>> compiled([True, False])
+        True
+        >>> compiled([True, True])
+        False
+
+        """
+        if self._compiled_cache is not None:
+            return self._compiled_cache
+        index = {id(atom): position for position, atom in enumerate(self.get_atoms())}
+        names = {}
+        lines = []
+
+        def emit(formula: LogicFormula) -> str:
+            name = names.get(id(formula))
+            if name is not None:
+                return name
+            operator = formula._operator
+            if operator == "atom":
+                expression = f"values[{index[id(formula)]}]"
+            elif operator == "TRUE":
+                expression = "True"
+            elif operator == "FALSE":
+                expression = "False"
+            elif operator == "~":
+                expression = f"not {emit(formula._components[0])}"
+            elif operator == "&":
+                expression = " and ".join(
+                    emit(component) for component in formula._components
+                )
+            elif operator == "|":
+                expression = " or ".join(
+                    emit(component) for component in formula._components
+                )
+            else:
+                left, right = formula._components
+                if operator == "->":
+                    expression = f"(not {emit(left)}) or {emit(right)}"
+                else:
+                    expression = f"{emit(left)} == {emit(right)}"
+            name = f"value_{len(names)}"
+            names[id(formula)] = name
+            lines.append(f"    {name} = {expression}")
+            return name
+
+        result = emit(self)
+        source = "def compiled(values):\n" + "\n".join(lines) + f"\n    return {result}"
+        namespace = {}
+        exec(source, namespace)
+        self._compiled_cache = namespace["compiled"]
+        return self._compiled_cache
+
+    def eval_all(self, atoms: list[LogicFormula] = None):
+        """
+        Evaluates the formula under every possible valuation in a single pass.
+
+        Notes
+        -----
+        When NumPy is available, each atom becomes a boolean column over all
+        valuations and the formula is computed with vectorized array operations,
+        one per operator. If the NumPy package is not found, the method falls
+        back to evaluating the formula row by row.
+
+        Parameters
+        ----------
+        atoms: list of LogicFormula, optional
+            The atom ordering that defines how valuations are enumerated. Passing a
+            shared ordering allows comparing the results of different formulas.
+            Default value is the ordering of `get_atoms()`.
+
+        Returns
+        -------
+        truth_values: numpy.ndarray or list of bool
+            The truth value of the formula for each valuation, with valuations
+            enumerated in the same order used by `get_truth_table`.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> [bool(value) for value in (P & Q).eval_all()]
+        [True, False, False, False]
+
+        """
+        if atoms is None:
+            atoms = self.get_atoms()
+        numpy = _get_numpy()
+        if numpy is None:
+            warnings.warn(
+                "Optional dependency 'numpy' not found. Falling back to row-by-row evaluation.",
+                ImportWarning,
+            )
+            n = len(atoms)
+            index = {id(atom): position for position, atom in enumerate(atoms)}
+            return [
+                self._eval_vec(
+                    [((row >> (n - 1 - position)) & 1) == 0 for position in range(n)],
+                    index,
+                )
+                for row in range(1 << n)
+            ]
+
+        row_numbers = numpy.arange(1 << len(atoms))
+        columns = {
+            id(atom): ((row_numbers >> (len(atoms) - 1 - position)) & 1) == 0
+            for position, atom in enumerate(atoms)
+        }
+
+        def column(formula: LogicFormula):
+            operator = formula._operator
+            if operator == "atom":
+                return columns[id(formula)]
+            if operator == "~":
+                return ~column(formula._components[0])
+            if operator == "TRUE":
+                return numpy.ones(row_numbers.shape, dtype=bool)
+            if operator == "FALSE":
+                return numpy.zeros(row_numbers.shape, dtype=bool)
+            components = formula._components
+            if operator == "&":
+                result = column(components[0])
+                for component in components[1:]:
+                    result = result & column(component)
+                return result
+            if operator == "|":
+                result = column(components[0])
+                for component in components[1:]:
+                    result = result | column(component)
+                return result
+            left, right = components
+            if operator == "->":
+                return ~column(left) | column(right)
+            return column(left) == column(right)
+
+        return column(self)
 
     def get_truth_table(self, show_intermediate=True, to_list=False):
         """
@@ -293,47 +828,188 @@ class LogicFormula:
          [False, False, True, True]]
 
         """
-        from itertools import product
-
         if not to_list:
-            try:
-                from pandas import DataFrame
-            except ImportError:
+            DataFrame = _get_dataframe()
+            if DataFrame is None:
                 warnings.warn(
                     "Optional dependency 'pandas' not found. Falling back to a list of lists.",
                     ImportWarning,
                 )
-                DataFrame = None
 
         atoms = self.get_atoms()
         if show_intermediate:
             subformulas = self.get_subformulas()
         else:
             subformulas = atoms + [self]
-        table = []
-        valuation_dicts = [
-            {atom: value for atom, value in zip(atoms, valuation)}
-            for valuation in product((True, False), repeat=len(atoms))
-        ]
-        for valuation in valuation_dicts:
-            table.append([formula.eval(valuation) for formula in subformulas])
+        numpy = _get_numpy()
+        if numpy is not None:
+            row_numbers = numpy.arange(1 << len(atoms))
+            columns = {
+                id(atom): ((row_numbers >> (len(atoms) - 1 - position)) & 1) == 0
+                for position, atom in enumerate(atoms)
+            }
+
+            def column_of(formula: LogicFormula):
+                cached = columns.get(id(formula))
+                if cached is not None:
+                    return cached
+                operator = formula._operator
+                if operator == "~":
+                    column = ~column_of(formula._components[0])
+                elif operator == "TRUE":
+                    column = numpy.ones(row_numbers.shape, dtype=bool)
+                elif operator == "FALSE":
+                    column = numpy.zeros(row_numbers.shape, dtype=bool)
+                elif operator == "&":
+                    column = column_of(formula._components[0])
+                    for component in formula._components[1:]:
+                        column = column & column_of(component)
+                elif operator == "|":
+                    column = column_of(formula._components[0])
+                    for component in formula._components[1:]:
+                        column = column | column_of(component)
+                else:
+                    left, right = formula._components
+                    if operator == "->":
+                        column = ~column_of(left) | column_of(right)
+                    else:
+                        column = column_of(left) == column_of(right)
+                columns[id(formula)] = column
+                return column
+
+            table = numpy.column_stack(
+                [column_of(formula) for formula in subformulas]
+            ).tolist()
+        else:
+            table = []
+            n = len(atoms)
+            index = {id(atom): position for position, atom in enumerate(atoms)}
+            for row in range(1 << n):
+                values = [
+                    ((row >> (n - 1 - position)) & 1) == 0 for position in range(n)
+                ]
+                memo = {}
+                table.append(
+                    [
+                        formula._eval_vec(values, index, memo)
+                        for formula in subformulas
+                    ]
+                )
         return (
             [subformulas] + table
             if to_list or DataFrame is None
             else (DataFrame(table, columns=subformulas))
         )
 
+    @staticmethod
+    def _atom_bit_columns(n: int) -> list[int]:
+        """
+        Returns the packed truth columns of `n` atoms as integers.
+
+        Bit `r` of the k-th column is the truth value of the k-th atom in the r-th
+        valuation, with valuations enumerated in the order used by `get_truth_table`
+        (all atoms true first). The columns depend only on `n`, so they are built
+        once per arity and cached class-wide.
+        """
+        cached = LogicFormula._bit_column_cache.get(n)
+        if cached is not None:
+            return cached
+        rows = 1 << n
+        columns = []
+        for position in range(n):
+            half_period = 1 << (n - 1 - position)
+            block = (1 << half_period) - 1
+            column = 0
+            shift = 0
+            while shift < rows:
+                column |= block << shift
+                shift += 2 * half_period
+            columns.append(column)
+        LogicFormula._bit_column_cache[n] = columns
+        return columns
+
+    def _eval_all_bitmask(self, atoms: list[LogicFormula] = None) -> int:
+        """
+        Evaluates the formula under every valuation, packed into a single integer.
+
+        The formula tree is walked once, computing for each node an integer whose
+        bit `r` is the node's truth value in the r-th valuation; each operator then
+        processes all 2^n valuations with one bitwise operation. Bit order matches
+        the row order of `get_truth_table`.
+        """
+        if atoms is None:
+            atoms = self.get_atoms()
+        mask = (1 << (1 << len(atoms))) - 1
+        columns = {
+            id(atom): column
+            for atom, column in zip(atoms, self._atom_bit_columns(len(atoms)))
+        }
+        memo = {}
+
+        def column_of(formula: LogicFormula) -> int:
+            cached = memo.get(id(formula))
+            if cached is not None:
+                return cached
+            operator = formula._operator
+            if operator == "atom":
+                column = columns[id(formula)]
+            elif operator == "TRUE":
+                column = mask
+            elif operator == "FALSE":
+                column = 0
+            elif operator == "~":
+                column = ~column_of(formula._components[0]) & mask
+            else:
+                if operator == "&":
+                    column = mask
+                    for component in formula._components:
+                        column &= column_of(component)
+                        if not column:
+                            break
+                elif operator == "|":
+                    column = 0
+                    for component in formula._components:
+                        column |= column_of(component)
+                        if column == mask:
+                            break
+                else:
+                    left, right = formula._components
+                    if operator == "->":
+                        column = (~column_of(left) | column_of(right)) & mask
+                    else:
+                        column = ~(column_of(left) ^ column_of(right)) & mask
+            memo[id(formula)] = column
+            return column
+
+        return column_of(self)
+
     def is_tautology(self) -> bool:
         """Checks if the logical formula is a tautology, i.e., it evaluates to true
-        for all possible valuations."""
-        truth_table = self.get_truth_table(show_intermediate=True, to_list=True)[1:]
-        return all(row[-1] for row in truth_table)
+        for all possible valuations. The result is cached on the interned node."""
+        cached = self._tautology_cache
+        if cached is None:
+            atoms = self.get_atoms(ordered=False)
+            if len(atoms) > LogicFormula._sat_solver_threshold:
+                cached = not _solve_sat(~self)
+            else:
+                cached = (
+                    self._eval_all_bitmask(atoms) == (1 << (1 << len(atoms))) - 1
+                )
+            self._tautology_cache = cached
+        return cached
 
     def is_contradiction(self) -> bool:
         """Checks if the logical formula is a contradiction, i.e., it evaluates to false
-        for all possible valuations."""
-        truth_table = self.get_truth_table(show_intermediate=True, to_list=True)[1:]
-        return all(not row[-1] for row in truth_table)
+        for all possible valuations. The result is cached on the interned node."""
+        cached = self._contradiction_cache
+        if cached is None:
+            atoms = self.get_atoms(ordered=False)
+            if len(atoms) > LogicFormula._sat_solver_threshold:
+                cached = not _solve_sat(self)
+            else:
+                cached = self._eval_all_bitmask(atoms) == 0
+            self._contradiction_cache = cached
+        return cached
 
     def is_satisfiable(self) -> bool:
         """Checks if the logical formula is satisfiable, i.e., it evaluates to true
@@ -372,16 +1048,7 @@ class LogicFormula:
          {'P': False, 'Q': False}]
 
         """
-        truth_table = self.get_truth_table(show_intermediate=False, to_list=True)
-        atoms = truth_table[0][:-1]
-        return [
-            {
-                str(atom) if string_atoms else atom: value
-                for atom, value in zip(atoms, row)
-            }
-            for row in truth_table[1:]
-            if row[-1]
-        ]
+        return self._valuations_where(True, string_atoms)
 
     def is_falsifiable(self) -> bool:
         """Checks if the logical formula is falsifiable, i.e., it evaluates to false
@@ -416,17 +1083,121 @@ class LogicFormula:
         [{'P': True, 'Q': False}]
 
         """
-        truth_table = self.get_truth_table(show_intermediate=False, to_list=True)
-        atoms = truth_table[0][:-1]
+        return self._valuations_where(False, string_atoms)
+
+    def _valuations_where(self, truth: bool, string_atoms: bool) -> list[dict]:
+        """
+        Returns the valuations under which the formula takes the given truth value.
+
+        The rows are decoded directly from the packed evaluator: bit `r` selects
+        the r-th valuation and each atom's value is read back from the bits of
+        `r`, so no truth table and no per-row evaluation is needed.
+        """
+        atoms = self.get_atoms()
+        n = len(atoms)
+        packed = self._eval_all_bitmask(atoms)
+        keys = [str(atom) if string_atoms else atom for atom in atoms]
         return [
             {
-                str(atom) if string_atoms else atom: value
-                for atom, value in zip(atoms, row)
+                key: ((row >> (n - 1 - position)) & 1) == 0
+                for position, key in enumerate(keys)
             }
-            for row in truth_table[1:]
-            if not row[-1]
+            for row in range(1 << n)
+            if bool((packed >> row) & 1) == truth
         ]
 
+    def simplify(self) -> LogicFormula:
+        """
+        Returns an equivalent formula with redundant structure rewritten away.
+
+        The tree is rewritten bottom-up: double negations cancel, duplicate
+        operands of a conjunction or disjunction are dropped, complementary
+        pairs collapse to a constant, absorption removes operands subsumed by
+        another (`x & (x | y)` becomes `x`), `x -> x` and `x <-> x` become
+        TRUE, and the TRUE/FALSE constants propagate through every connective.
+        The original formula is unchanged; the result is a shared interned
+        node, possibly a constant.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> (P & (Q >> Q)).simplify()
+        LogicFormula(P)
+        >>> (P & ~P).simplify()
+        LogicFormula(\u22A5)
+        >>> (~~P | (Q & Q)).simplify()
+        LogicFormula(P \u2228 Q)
+
+        """
+        memo = {}
+        true, false = LogicFormula.TRUE, LogicFormula.FALSE
+
+        def simplify_node(formula: LogicFormula) -> LogicFormula:
+            result = memo.get(id(formula))
+            if result is not None:
+                return result
+            operator = formula._operator
+            if not formula._components:
+                result = formula
+            elif operator == "~":
+                component = simplify_node(formula._components[0])
+                if component._operator == "~":
+                    result = component._components[0]
+                else:
+                    result = component.negation()
+            elif operator == "&" or operator == "|":
+                identity, absorbing = (
+                    (true, false) if operator == "&" else (false, true)
+                )
+                kept = []
+                kept_ids = set()
+                result = None
+                for component in formula._components:
+                    component = simplify_node(component)
+                    if component is absorbing:
+                        result = absorbing
+                        break
+                    if component is identity or id(component) in kept_ids:
+                        continue
+                    kept.append(component)
+                    kept_ids.add(id(component))
+                if result is None and any(
+                    component._operator == "~"
+                    and id(component._components[0]) in kept_ids
+                    for component in kept
+                ):
+                    result = absorbing
+                if result is None:
+                    dual = "|" if operator == "&" else "&"
+                    kept = [
+                        component
+                        for component in kept
+                        if component._operator != dual
+                        or not any(
+                            id(part) in kept_ids for part in component._components
+                        )
+                    ]
+                    if not kept:
+                        result = identity
+                    elif len(kept) == 1:
+                        result = kept[0]
+                    else:
+                        result = LogicFormula(operator, *kept)
+            else:
+                left, right = (
+                    simplify_node(component) for component in formula._components
+                )
+                if left is right:
+                    result = true
+                elif operator == "->":
+                    result = left.implication(right)
+                else:
+                    result = left.biconditional(right)
+            memo[id(formula)] = result
+            return result
+
+        return simplify_node(self)
+
     def is_equivalent(self, other: LogicFormula) -> bool:
         """
         Checks if the current formula is logically equivalent to another formula instance.
@@ -447,7 +1218,123 @@ class LogicFormula:
         True
 
         """
-        return self.biconditional(other).is_tautology()
+        if self is other:
+            return True
+        if self._bdd_cache is not None and other._bdd_cache is not None:
+            return self._bdd_cache == other._bdd_cache
+        union = {id(atom): atom for atom in self.get_atoms(ordered=False)}
+        for atom in other.get_atoms(ordered=False):
+            union.setdefault(id(atom), atom)
+        atoms = sorted(union.values(), key=str)
+        if len(atoms) > LogicFormula._sat_solver_threshold:
+            return not _solve_sat(LogicFormula("<->", self, other).negation())
+        return self._eval_all_bitmask(atoms) == other._eval_all_bitmask(atoms)
+
+    def to_bdd(self, manager):
+        """
+        Converts the formula to a binary decision diagram node.
+
+        Because reduced ordered BDDs are canonical, two equivalent formulas converted
+        with the same manager and variable order produce the same node, so tautology
+        and equivalence checks become single node comparisons instead of truth-table
+        sweeps.
+
+        Parameters
+        ----------
+        manager:
+            A BDD manager following the interface of the `dd` package (such as
+            `dd.autoref.BDD`), providing the `declare`, `var` and `apply` methods.
+            The atoms of the formula are declared as BDD variables by their symbols.
+
+        Returns
+        -------
+        bdd_node:
+            The node representing the formula in the given manager.
+
+        """
+        operator = self._operator
+        if operator == "atom":
+            symbol = self._symbol
+            manager.declare(symbol)
+            return manager.var(symbol)
+        if operator == "TRUE":
+            return manager.true
+        if operator == "FALSE":
+            return manager.false
+        if operator == "~":
+            return manager.apply("not", self._components[0].to_bdd(manager))
+        operator_names = {"&": "and", "|": "or", "->": "implies", "<->": "equiv"}
+        name = operator_names[operator]
+        result = self._components[0].to_bdd(manager)
+        for component in self._components[1:]:
+            result = manager.apply(name, result, component.to_bdd(manager))
+        return result
+
+    def to_robdd(self, manager=None) -> int:
+        """
+        Converts the formula to a node of the in-library ROBDD backend.
+
+        Unlike `to_bdd`, this requires no external package: the manager keeps a
+        unique table of (variable, low, high) triples, so equivalent formulas
+        built through the same manager reduce to the same integer node and
+        tautology checks avoid enumerating the full truth table.
+
+        Parameters
+        ----------
+        manager: BDDManager, optional
+            The manager to build the diagram in. When omitted, the shared
+            default manager is used, so nodes returned by separate calls can be
+            compared directly.
+
+        Returns
+        -------
+        node: int
+            The integer identifying the formula's diagram in the manager.
+
+        Examples
+        --------
+        >>> from pyproplogic.common import P, Q
+        >>> (P & Q).to_robdd() == (~(~P | ~Q)).to_robdd()
+        True
+        >>> from pyproplogic.bdd import default_manager
+        >>> (P | ~P).to_robdd() == default_manager().true
+        True
+
+        """
+        from pyproplogic.bdd import default_manager
+
+        cache_nodes = manager is None
+        if cache_nodes:
+            if self._bdd_cache is not None:
+                return self._bdd_cache
+            manager = default_manager()
+        for atom in self.get_atoms():
+            manager.declare(atom._symbol)
+        memo = {}
+
+        def build(formula: LogicFormula) -> int:
+            node = memo.get(id(formula))
+            if node is not None:
+                return node
+            operator = formula._operator
+            if operator == "atom":
+                node = manager.var(formula._symbol)
+            elif operator == "TRUE":
+                node = manager.true
+            elif operator == "FALSE":
+                node = manager.false
+            elif operator == "~":
+                node = manager.negate(build(formula._components[0]))
+            else:
+                node = build(formula._components[0])
+                for component in formula._components[1:]:
+                    node = manager.apply(operator, node, build(component))
+            memo[id(formula)] = node
+            if cache_nodes and formula._bdd_cache is None:
+                formula._bdd_cache = node
+            return node
+
+        return build(self)
 
     @classmethod
     def get_symbols(cls) -> dict[str]:
@@ -484,10 +1371,12 @@ class LogicFormula:
         - `LogicFormula.set_latex_symbols()` sets the representation to LaTeX.
 
         """
-        cls._current_dict = {
-            key: symbols.get(key, cls.get_symbols()[key])
-            for key in cls.get_symbols().keys()
-        }
+        cls._current_dict = MappingProxyType(
+            {
+                key: symbols.get(key, cls.get_symbols()[key])
+                for key in cls.get_symbols().keys()
+            }
+        )
 
     @classmethod
     def set_unicode_symbols(cls):
@@ -496,11 +1385,7 @@ class LogicFormula:
 
     def to_unicode(self) -> str:
         """Returns the formula as an Unicode string."""
-        previous_dict = LogicFormula._current_dict
-        LogicFormula.set_unicode_symbols()
-        unicode_formula = str(self)
-        LogicFormula._current_dict = previous_dict
-        return unicode_formula
+        return self._render(LogicFormula._unicode_dict)
 
     @classmethod
     def set_utf_symbols(cls):
@@ -509,24 +1394,16 @@ class LogicFormula:
 
     def to_utf(self) -> str:
         """Returns the formula as an UTF-8 string."""
-        previous_dict = LogicFormula._current_dict
-        LogicFormula.set_utf_symbols()
-        utf_formula = str(self)
-        LogicFormula._current_dict = previous_dict
-        return utf_formula
+        return self._render(LogicFormula._utf_dict)
 
     @classmethod
     def set_ascii_symbols(cls):
         """Sets the symbol dictionary to use ASCII symbols for the logical operatos."""
-        cls._current_dict = {key: key for key in cls._current_dict.keys()}
+        cls._current_dict = cls._ascii_dict
 
     def to_ascii(self) -> str:
         """Returns the formula as an ASCII string."""
-        previous_dict = LogicFormula._current_dict
-        LogicFormula.set_ascii_symbols()
-        ascii_formula = str(self)
-        LogicFormula._current_dict = previous_dict
-        return ascii_formula
+        return self._render(LogicFormula._ascii_dict)
 
     @classmethod
     def set_latex_symbols(cls):
@@ -552,11 +1429,7 @@ class LogicFormula:
         \lnot (P \land (Q \rightarrow P))
 
         """
-        previous_dict = LogicFormula._current_dict
-        LogicFormula.set_latex_symbols()
-        latex_formula = str(self)
-        LogicFormula._current_dict = previous_dict
-        return latex_formula
+        return self._render(LogicFormula._latex_dict)
 
     def to_latex_tikz(
         self, tikz_parameters="sibling distance=25mm/#1", use_tabs=False
@@ -594,30 +1467,31 @@ class LogicFormula:
             \end{tikzpicture}
 
         """
-        latex = LogicFormula._latex_dict
         tab = "\t" if use_tabs else " " * 4
-        child_template = "child {{node {{${}$}}"
-
-        def parse_tree(formula: LogicFormula, level=1) -> str:
-            identation = tab * level
-            if formula.is_atomic():
-                return identation + child_template.format(str(formula)) + "}"
-            string = identation + child_template.format(latex[formula.operator()])
-            for subformula in formula.components():
-                string += "\n" + identation + parse_tree(subformula, level + 1)
-            string += "}"
-            return string
-
         if self.is_atomic():
             return f"{tab}\\node {{${self.operator()}$}}"
-        string = f"{tab}\\node {{${latex[self.operator()]}$}}"
+        parts = [f"{tab}\\node {{${LogicFormula._latex_dict[self.operator()]}$}}"]
         for subformula in self.components():
-            string += "\n" + tab + parse_tree(subformula)
-        string += ";"
-        tikz_code = (
-            "\\begin{{tikzpicture}}\n"
-            "[level/.style={{{}}}]\n"
-            "{}\n"
-            "\\end{{tikzpicture}}"
+            parts.append("\n" + tab)
+            subformula._tikz_parse_tree(1, parts, tab)
+        parts.append(";")
+        return LogicFormula._tikz_template.format(tikz_parameters, "".join(parts))
+
+    def _tikz_parse_tree(self, level: int, parts: list[str], tab: str):
+        """Appends the TikZ child nodes of the formula's parse tree to `parts`."""
+        identation = tab * level
+        if self.is_atomic():
+            parts.append(identation + LogicFormula._tikz_child_template.format(str(self)) + "}")
+            return
+        parts.append(
+            identation
+            + LogicFormula._tikz_child_template.format(LogicFormula._latex_dict[self.operator()])
         )
-        return tikz_code.format(tikz_parameters, string)
+        for subformula in self.components():
+            parts.append("\n" + identation)
+            subformula._tikz_parse_tree(level + 1, parts, tab)
+        parts.append("}")
+
+
+LogicFormula.TRUE = LogicFormula("TRUE")
+LogicFormula.FALSE = LogicFormula("FALSE")
@@ -1,5 +1,10 @@
+import random as _random
+
 from pyproplogic import LogicFormula
 
+_DEFAULT_ATOMS = tuple(chr(ord("P") + x) for x in range(11))
+_OPERATORS = ("~", "&", "|", "->", "<->")
+
 
 def random_formula(n: int, atom_list=None) -> LogicFormula:
     """
@@ -14,19 +19,26 @@ def random_formula(n: int, atom_list=None) -> LogicFormula:
         A list of atom names to be picked. Default value is [P - Z].
 
     """
-    import random
-
-    if n == 1:
-        return LogicFormula.atom(
-            random.choice(
-                atom_list if atom_list else [chr(ord("P") + x) for x in range(11)]
-            )
-        )
-    operator = random.choice(("~", "&", "|", "->", "<->"))
-    if operator == "~":
-        return random_formula(n - 1, atom_list).negation()
-    return LogicFormula(
-        operator,
-        random_formula(n // 2, atom_list),
-        random_formula(n - n // 2, atom_list),
-    )
+    atoms = tuple(atom_list) if atom_list else _DEFAULT_ATOMS
+    work = [n]
+    results = []
+    while work:
+        task = work.pop()
+        if isinstance(task, str):
+            if task == "~":
+                results.append(results.pop().negation())
+            else:
+                right = results.pop()
+                left = results.pop()
+                results.append(LogicFormula(task, left, right))
+        elif task == 1:
+            results.append(LogicFormula.atom(_random.choice(atoms)))
+        else:
+            operator = _random.choice(_OPERATORS)
+            work.append(operator)
+            if operator == "~":
+                work.append(task - 1)
+            else:
+                work.append(task - task // 2)
+                work.append(task // 2)
+    return results[0]
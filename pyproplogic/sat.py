@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+
+def to_cnf_tseitin(formula) -> tuple[list[list[int]], int]:
+    """
+    Converts a formula to CNF clauses over integer literals via the Tseitin encoding.
+
+    Atoms are numbered from 1 in their sorted order and every internal
+    conjunction, disjunction, implication or biconditional introduces one
+    auxiliary variable constrained to be equivalent to it; negations reuse
+    their component's literal with the sign flipped. The encoding is linear in
+    the size of the formula and equisatisfiable with it.
+
+    Returns
+    -------
+    clauses: list of list of int
+        The CNF clauses, where a positive integer is a variable and a negative
+        integer its negation. The last clause asserts the formula's root.
+    variable_count: int
+        The total number of variables used, atoms and auxiliaries included.
+
+    Examples
+    --------
+    >>> from pyproplogic.common import P, Q
+    >>> clauses, variable_count = to_cnf_tseitin(P & Q)
+    >>> clauses
+    [[-3, 1], [-3, 2], [3, -1, -2], [3]]
+    >>> variable_count
+    3
+
+    """
+    variables = {}
+    for atom in formula.get_atoms():
+        variables[id(atom)] = len(variables) + 1
+    clauses = []
+    counter = [len(variables)]
+    memo = {}
+
+    def literal_of(node) -> int:
+        literal = memo.get(id(node))
+        if literal is not None:
+            return literal
+        operator = node._operator
+        if operator == "atom":
+            literal = variables[id(node)]
+        elif operator == "TRUE" or operator == "FALSE":
+            counter[0] += 1
+            literal = counter[0]
+            clauses.append([literal if operator == "TRUE" else -literal])
+        elif operator == "~":
+            literal = -literal_of(node._components[0])
+        else:
+            literals = [literal_of(component) for component in node._components]
+            counter[0] += 1
+            literal = counter[0]
+            if operator == "&":
+                for other in literals:
+                    clauses.append([-literal, other])
+                clauses.append([literal] + [-other for other in literals])
+            elif operator == "|":
+                for other in literals:
+                    clauses.append([literal, -other])
+                clauses.append([-literal] + literals)
+            elif operator == "->":
+                left, right = literals
+                clauses.append([literal, left])
+                clauses.append([literal, -right])
+                clauses.append([-literal, -left, right])
+            else:
+                left, right = literals
+                clauses.append([-literal, -left, right])
+                clauses.append([-literal, left, -right])
+                clauses.append([literal, left, right])
+                clauses.append([literal, -left, -right])
+        memo[id(node)] = literal
+        return literal
+
+    clauses.append([literal_of(formula)])
+    return clauses, counter[0]
+
+
+def dpll(clauses: list[list[int]], variable_count: int) -> bool:
+    """
+    Decides the satisfiability of a CNF clause set with a small DPLL solver.
+
+    Unit propagation runs over two watched literals per clause, so only the
+    clauses whose watch becomes false are visited when a variable is assigned.
+    Branching picks the lowest unassigned variable, trying true before false,
+    with chronological backtracking on conflict. The clause lists are reordered
+    in place while the watches move.
+
+    Examples
+    --------
+    >>> from pyproplogic.common import P, Q
+    >>> dpll(*to_cnf_tseitin(P & ~P))
+    False
+    >>> dpll(*to_cnf_tseitin((P >> Q) | P))
+    True
+
+    """
+    assignment = [0] * (variable_count + 1)
+    watches = {}
+    trail = []
+    queue = []
+
+    def assign(literal: int) -> bool:
+        variable = abs(literal)
+        value = 1 if literal > 0 else -1
+        current = assignment[variable]
+        if current:
+            return current == value
+        assignment[variable] = value
+        trail.append(variable)
+        queue.append(literal)
+        return True
+
+    for clause in clauses:
+        if len(clause) == 1:
+            if not assign(clause[0]):
+                return False
+        else:
+            watches.setdefault(clause[0], []).append(clause)
+            watches.setdefault(clause[1], []).append(clause)
+
+    def propagate() -> bool:
+        while queue:
+            false_literal = -queue.pop()
+            watching = watches.get(false_literal)
+            if not watching:
+                continue
+            still_watching = []
+            conflict = False
+            for position, clause in enumerate(watching):
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                other = clause[0]
+                other_value = assignment[abs(other)]
+                if other_value == (1 if other > 0 else -1):
+                    still_watching.append(clause)
+                    continue
+                for index in range(2, len(clause)):
+                    candidate = clause[index]
+                    value = assignment[abs(candidate)]
+                    if value == 0 or value == (1 if candidate > 0 else -1):
+                        clause[1], clause[index] = clause[index], clause[1]
+                        watches.setdefault(candidate, []).append(clause)
+                        break
+                else:
+                    still_watching.append(clause)
+                    if other_value == 0:
+                        if not assign(other):
+                            conflict = True
+                    else:
+                        conflict = True
+                    if conflict:
+                        still_watching.extend(watching[position + 1 :])
+                        break
+            watches[false_literal] = still_watching
+            if conflict:
+                queue.clear()
+                return False
+        return True
+
+    if not propagate():
+        return False
+    decisions = []
+    while True:
+        variable = 1
+        while variable <= variable_count and assignment[variable]:
+            variable += 1
+        if variable > variable_count:
+            return True
+        decisions.append([variable, len(trail), False])
+        assign(variable)
+        while not propagate():
+            while decisions and decisions[-1][2]:
+                _, mark, _ = decisions.pop()
+                while len(trail) > mark:
+                    assignment[trail.pop()] = 0
+            if not decisions:
+                return False
+            decision = decisions[-1]
+            decision[2] = True
+            while len(trail) > decision[1]:
+                assignment[trail.pop()] = 0
+            assign(-decision[0])
@@ -60,3 +60,17 @@ def test_is_equivalent():
     assert not P.is_equivalent(P | Q)
     assert not P.is_equivalent(Q)
     assert not (P | Q).is_equivalent(P)
+
+
+def test_large_formulas_use_sat_solver():
+    from functools import reduce
+    from pyproplogic import LogicFormula
+
+    atoms = [LogicFormula.atom(chr(ord("A") + x)) for x in range(26)]
+    conjunction = reduce(lambda formula, atom: formula & atom, atoms)
+    disjunction = reduce(lambda formula, atom: formula | atom, atoms)
+    assert conjunction.is_satisfiable()
+    assert conjunction.is_falsifiable()
+    assert (conjunction & ~atoms[0]).is_contradiction()
+    assert (disjunction | ~atoms[0]).is_tautology()
+    assert not (disjunction | ~atoms[0]).is_falsifiable()
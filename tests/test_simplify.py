@@ -0,0 +1,40 @@
+from pyproplogic import LogicFormula
+from pyproplogic.common import P, Q, R, TRUE, FALSE
+
+
+def test_constant_folding():
+    assert (P & True) is P
+    assert (P & False) is FALSE
+    assert (P | True) is TRUE
+    assert (P | False) is P
+    assert (False >> P) is TRUE
+    assert (P >> True) is TRUE
+    assert (True >> P) is P
+    assert ~TRUE is FALSE
+    assert ~FALSE is TRUE
+
+
+def test_constants_evaluate():
+    assert TRUE.is_tautology()
+    assert FALSE.is_contradiction()
+    formula = LogicFormula("&", P, TRUE)
+    assert formula.eval({P: True})
+    assert not formula.eval({P: False})
+
+
+def test_simplify():
+    assert (P & (Q >> Q)).simplify() is P
+    assert (P & ~P).simplify() is FALSE
+    assert (P | ~P).simplify() is TRUE
+    assert (~~P).simplify() is P
+    assert (P & P & Q).simplify() is (P & Q)
+    assert (P & (P | Q)).simplify() is P
+    assert (P | (P & Q)).simplify() is P
+    assert ((P >> Q) == (P >> Q)).simplify() is TRUE
+    assert (((P & True) | False) >> Q).simplify() is (P >> Q)
+
+
+def test_simplify_preserves_equivalence():
+    formula = (P >> (Q & Q)) | ~(R & (R | P))
+    simplified = formula.simplify()
+    assert (formula == simplified).is_tautology()